@@ -1,884 +1,971 @@
 #!/usr/bin/env python3
 import argparse
+import concurrent.futures
 import datetime as dt
+import functools
+import itertools
 import os
-import platform
 import random
+import re
 import sys
-import uuid
+from collections import defaultdict
+from typing import NamedTuple, Tuple
 
+# Runs of anything str.isalnum() rejects; \w is alphanumerics plus "_".
+_SLUG_SEPARATORS = re.compile(r"[\W_]+")
 
+
+class Entry(NamedTuple):
+    # os and arch hold values already quoted for YAML.
+    id: str
+    title: str
+    entry_type: str
+    source: str
+    cmd: str
+    os: str
+    arch: str
+    detected_at: str
+    status: str
+    tags: Tuple[str, ...]
+    rationale: str
+    verification: str = ""
+
+
+_TYPE_DIR = {
+    "package": "packages",
+    "config": "configs",
+    "application": "applications",
+    "script": "scripts",
+    "other": "other",
+}
+
+
+@functools.lru_cache(maxsize=1024)
 def slugify(value: str) -> str:
-    slug = []
-    last_dash = False
-    for ch in value:
-        if ch.isalnum():
-            slug.append(ch.lower())
-            last_dash = False
-        elif not last_dash:
-            slug.append("-")
-            last_dash = True
-    return "".join(slug).strip("-") or "entry"
+    return _SLUG_SEPARATORS.sub("-", value).strip("-").lower() or "entry"
 
 
+@functools.lru_cache(maxsize=4096)
 def yaml_quote(value: str) -> str:
+    if "\\" not in value and "\"" not in value:
+        return "\"" + value + "\""
     escaped = value.replace("\\", "\\\\").replace("\"", "\\\"")
     return f"\"{escaped}\""
 
 
+@functools.lru_cache(maxsize=None)
 def detect_system():
-    system = platform.system().lower()
-    if system.startswith("darwin"):
+    if sys.platform.startswith("darwin"):
         os_name = "macos"
-    elif system.startswith("windows"):
+    elif sys.platform.startswith("win"):
         os_name = "windows"
     else:
         os_name = "linux"
-    arch = platform.machine().lower() or "unknown"
-    return os_name, arch
+    try:
+        arch = os.uname().machine
+    except AttributeError:
+        arch = os.environ.get("PROCESSOR_ARCHITECTURE", "")
+    return os_name, arch.lower() or "unknown"
+
+
+def write_file(path, content):
+    # Files are small and written once, so skip the buffered text wrappers of open().
+    data = content.encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
 
 
 def write_entry(path, entry):
-    lines = []
-    lines.append("---")
-    lines.append(f"id: {entry['id']}")
-    lines.append(f"title: {yaml_quote(entry['title'])}")
-    lines.append(f"type: {entry['entry_type']}")
-    lines.append(f"source: {yaml_quote(entry['source'])}")
-    lines.append(f"cmd: {yaml_quote(entry['cmd'])}")
-    lines.append("system:")
-    lines.append(f"  os: {yaml_quote(entry['system']['os'])}")
-    lines.append(f"  arch: {yaml_quote(entry['system']['arch'])}")
-    lines.append(f"detected_at: {entry['detected_at']}")
-    lines.append(f"status: {entry['status']}")
-    lines.append("tags:")
-    for tag in entry["tags"]:
-        lines.append(f"  - {yaml_quote(tag)}")
-    lines.append("---")
-    lines.append("")
-    lines.append("# Rationale")
-    lines.append(entry["rationale"])
-    lines.append("")
-    lines.append("# Verification")
-    lines.append(entry.get("verification", ""))
-    lines.append("")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-
-
-def entry_path(root, entry):
-    type_dir = {
-        "package": "packages",
-        "config": "configs",
-        "application": "applications",
-        "script": "scripts",
-        "other": "other",
-    }[entry["entry_type"]]
-    filename = f"{entry['source']}-{slugify(entry['title'])}-{entry['id']}.md"
-    return os.path.join(root, "entries", type_dir, entry["source"], filename)
+    tags = "".join(f"  - {yaml_quote(tag)}\n" for tag in entry.tags)
+    write_file(
+        path,
+        "---\n"
+        f"id: {entry.id}\n"
+        f"title: {yaml_quote(entry.title)}\n"
+        f"type: {entry.entry_type}\n"
+        f"source: {yaml_quote(entry.source)}\n"
+        f"cmd: {yaml_quote(entry.cmd)}\n"
+        "system:\n"
+        f"  os: {entry.os}\n"
+        f"  arch: {entry.arch}\n"
+        f"detected_at: {entry.detected_at}\n"
+        f"status: {entry.status}\n"
+        "tags:\n"
+        f"{tags}"
+        "---\n"
+        "\n"
+        "# Rationale\n"
+        f"{entry.rationale}\n"
+        "\n"
+        "# Verification\n"
+        f"{entry.verification}\n",
+    )
+
+
+def entry_filename(entry):
+    return f"{entry.source}-{slugify(entry.title)}-{entry.id}.md"
+
+
+def write_bucket(entries_root, entry_type, source, entries):
+    directory = os.path.join(entries_root, _TYPE_DIR[entry_type], source)
+    os.makedirs(directory, exist_ok=True)
+    for entry in entries:
+        write_entry(f"{directory}{os.sep}{entry_filename(entry)}", entry)
 
 
 def write_yaml_list(path, items):
-    lines = []
+    chunks = []
     for item in items:
-        lines.append("-")
-        lines.append(f"  id: {item['id']}")
-        if item.get("path") is None:
-            lines.append("  path: null")
-        else:
-            lines.append(f"  path: {yaml_quote(item['path'])}")
-        lines.append(f"  title: {yaml_quote(item['title'])}")
-        lines.append(f"  type: {item['entry_type']}")
-        lines.append(f"  source: {yaml_quote(item['source'])}")
-        lines.append(f"  cmd: {yaml_quote(item['cmd'])}")
-        lines.append("  system:")
-        lines.append(f"    os: {yaml_quote(item['system']['os'])}")
-        lines.append(f"    arch: {yaml_quote(item['system']['arch'])}")
-        lines.append(f"  detected_at: {item['detected_at']}")
-        lines.append("  tags:")
-        for tag in item["tags"]:
-            lines.append(f"    - {yaml_quote(tag)}")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+        path_value = "null" if item.get("path") is None else yaml_quote(item["path"])
+        tags = "".join(f"    - {yaml_quote(tag)}\n" for tag in item["tags"])
+        chunks.append(
+            "-\n"
+            f"  id: {item['id']}\n"
+            f"  path: {path_value}\n"
+            f"  title: {yaml_quote(item['title'])}\n"
+            f"  type: {item['entry_type']}\n"
+            f"  source: {yaml_quote(item['source'])}\n"
+            f"  cmd: {yaml_quote(item['cmd'])}\n"
+            "  system:\n"
+            f"    os: {item['os']}\n"
+            f"    arch: {item['arch']}\n"
+            f"  detected_at: {item['detected_at']}\n"
+            "  tags:\n"
+            f"{tags}"
+        )
+    write_file(path, "".join(chunks) or "\n")
+
+
+def fast_uuid4() -> str:
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    h = raw.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
 
 
 def now_iso():
     return dt.datetime.now(dt.timezone.utc).isoformat()
 
 
-def make_entry(system, spec, status="active"):
-    return {
-        "id": str(uuid.uuid4()),
-        "title": spec["title"],
-        "entry_type": spec["entry_type"],
-        "source": spec["source"],
-        "cmd": spec["cmd"],
-        "system": {"os": system[0], "arch": system[1]},
-        "detected_at": now_iso(),
-        "status": status,
-        "tags": spec["tags"],
-        "rationale": spec["rationale"],
-        "verification": spec.get("verification", ""),
-    }
+def make_entry(os_yaml, arch_yaml, spec, detected_at, status="active"):
+    return Entry(
+        id=fast_uuid4(),
+        title=spec["title"],
+        entry_type=spec["entry_type"],
+        source=spec["source"],
+        cmd=spec["cmd"],
+        os=os_yaml,
+        arch=arch_yaml,
+        detected_at=detected_at,
+        status=status,
+        tags=spec["tags"],
+        rationale=spec["rationale"],
+        verification=spec.get("verification", ""),
+    )
 
 
-def make_detected(system, spec):
+def make_detected(os_yaml, arch_yaml, spec, detected_at):
     return {
-        "id": str(uuid.uuid4()),
+        "id": fast_uuid4(),
         "path": spec.get("path"),
         "title": spec["title"],
         "entry_type": spec["entry_type"],
         "source": spec["source"],
         "cmd": spec["cmd"],
-        "system": {"os": system[0], "arch": system[1]},
-        "detected_at": now_iso(),
+        "os": os_yaml,
+        "arch": arch_yaml,
+        "detected_at": detected_at,
         "tags": spec["tags"],
     }
 
 
-def build_demo_specs(os_name):
-    base = [
-        {
-            "title": ".gitconfig",
-            "entry_type": "config",
-            "source": "dotfiles",
-            "cmd": "open ~/.gitconfig",
-            "tags": ["config", "git"],
-            "rationale": "Consistent author identity and diff settings reduce review friction.",
-        },
-        {
-            "title": ".zshrc",
-            "entry_type": "config",
-            "source": "dotfiles",
-            "cmd": "open ~/.zshrc",
-            "tags": ["shell", "config"],
-            "rationale": "Shell settings keep tooling and aliases aligned.",
-        },
-        {
-            "title": "CLI bootstrap script",
-            "entry_type": "script",
-            "source": "manual",
-            "cmd": "./scripts/bootstrap.sh",
-            "tags": ["bootstrap", "automation"],
-            "rationale": "Single entrypoint reduces onboarding time for new machines.",
-        },
-        {
-            "title": "README.md onboarding notes",
-            "entry_type": "config",
-            "source": "manual",
-            "cmd": "open docs/guides/user-manual.md",
-            "tags": ["documentation"],
-            "rationale": "Keeps setup steps visible and reviewed during handoffs.",
-        },
-        {
-            "title": "npm: typescript",
-            "entry_type": "package",
-            "source": "npm",
-            "cmd": "npm install -g typescript",
-            "tags": ["typescript", "tooling"],
-            "rationale": "Global tsc keeps CLI scripts and build steps aligned.",
-            "verification": "tsc --version",
-        },
-        {
-            "title": "npm: eslint",
-            "entry_type": "package",
-            "source": "npm",
-            "cmd": "npm install -g eslint",
-            "tags": ["lint", "tooling"],
-            "rationale": "Baseline linting keeps code quality consistent.",
-            "verification": "eslint --version",
-        },
-        {
-            "title": "npm: prettier",
-            "entry_type": "package",
-            "source": "npm",
-            "cmd": "npm install -g prettier",
-            "tags": ["formatting"],
-            "rationale": "Shared formatting prevents noisy diffs.",
-            "verification": "prettier --version",
-        },
-        {
-            "title": "cargo: just",
-            "entry_type": "package",
-            "source": "cargo",
-            "cmd": "cargo install just",
-            "tags": ["task-runner", "cli"],
-            "rationale": "One command surface for common project workflows.",
-            "verification": "just --version",
-        },
+_BREW_FORMULAE = (
+    "ripgrep",
+    "jq",
+    "bat",
+    "fd",
+    "fzf",
+    "gh",
+    "htop",
+    "tree",
+    "wget",
+    "curl",
+    "git",
+    "git-lfs",
+    "python",
+    "node",
+    "go",
+    "rust",
+    "cmake",
+    "openssl@3",
+    "sqlite",
+    "postgresql",
+    "redis",
+    "docker",
+    "docker-compose",
+    "kubectl",
+    "helm",
+    "terraform",
+    "awscli",
+    "gcloud",
+    "k9s",
+    "pandoc",
+    "ffmpeg",
+    "tesseract",
+    "graphviz",
+    "imagemagick",
+    "ngrok",
+    "zstd",
+    "xz",
+    "rsync",
+    "rclone",
+    "openjdk",
+    "gradle",
+    "maven",
+    "direnv",
+    "shellcheck",
+    "pre-commit",
+    "poetry",
+    "pipx",
+    "uv",
+)
+
+_BREW_CASKS = (
+    "Visual Studio Code",
+    "Slack",
+    "Figma",
+    "Postman",
+    "Google Chrome",
+    "Raycast",
+    "Docker Desktop",
+    "Notion",
+    "Zoom",
+    "Spotify",
+    "Discord",
+    "1Password",
+    "Warp",
+    "Obsidian",
+    "Arc",
+    "Alfred",
+    "Rectangle",
+    "Miro",
+    "Notion Calendar",
+    "Microsoft Teams",
+    "Microsoft Word",
+    "Microsoft Excel",
+    "Microsoft PowerPoint",
+    "GitHub Desktop",
+    "Insomnia",
+    "TablePlus",
+    "Android Studio",
+    "Xcode",
+    "iTerm",
+    "Chrome Canary",
+    "Firefox",
+    "Brave Browser",
+    "Whimsical",
+)
+
+_MAC_DEFAULTS = (
+    "NSGlobalDomain",
+    "com.apple.finder",
+    "com.apple.dock",
+    "com.apple.screencapture",
+    "com.apple.trackpad",
+    "com.apple.controlcenter",
+    "com.apple.universalaccess",
+    "com.apple.SoftwareUpdate",
+    "com.apple.menuextra.clock",
+    "com.apple.screensaver",
+)
+
+_APT_PACKAGES = (
+    "build-essential",
+    "curl",
+    "wget",
+    "git",
+    "git-lfs",
+    "ripgrep",
+    "jq",
+    "fzf",
+    "fd-find",
+    "htop",
+    "tree",
+    "python3",
+    "python3-pip",
+    "nodejs",
+    "npm",
+    "docker.io",
+    "docker-compose",
+    "kubectl",
+    "helm",
+    "terraform",
+    "sqlite3",
+    "postgresql",
+    "redis-server",
+    "openssh-client",
+    "rsync",
+    "unzip",
+    "zip",
+    "make",
+    "cmake",
+    "clang",
+    "openssl",
+    "neovim",
+)
+
+_PACMAN_PACKAGES = (
+    "base-devel",
+    "git",
+    "ripgrep",
+    "jq",
+    "fzf",
+    "fd",
+    "htop",
+    "tree",
+    "python",
+    "nodejs",
+    "npm",
+    "docker",
+    "docker-compose",
+    "kubectl",
+    "helm",
+    "terraform",
+    "postgresql",
+    "redis",
+    "sqlite",
+    "openssh",
+    "rsync",
+    "cmake",
+    "neovim",
+)
+
+_DNF_PACKAGES = (
+    "git",
+    "ripgrep",
+    "jq",
+    "fzf",
+    "htop",
+    "tree",
+    "python3",
+    "nodejs",
+    "npm",
+    "docker",
+    "docker-compose",
+    "kubectl",
+    "helm",
+    "terraform",
+    "postgresql",
+    "redis",
+    "sqlite",
+    "openssh",
+    "rsync",
+    "cmake",
+    "neovim",
+)
+
+_FLATPAK_APPS = (
+    "org.mozilla.firefox",
+    "com.slack.Slack",
+    "com.visualstudio.code",
+    "com.spotify.Client",
+    "com.discordapp.Discord",
+    "md.obsidian.Obsidian",
+    "com.getpostman.Postman",
+    "com.github.IsmaelMartinez.teams_for_linux",
+    "com.google.Chrome",
+    "io.dbeaver.DBeaverCommunity",
+    "com.todoist.Todoist",
+    "org.gnome.Calculator",
+    "org.gnome.Terminal",
+)
+
+_SNAP_APPS = (
+    "postman",
+    "spotify",
+    "slack",
+    "code",
+    "discord",
+    "chromium",
+    "notion-snap",
+    "zoom-client",
+    "intellij-idea-community",
+    "pycharm-community",
+    "insomnia",
+    "telegram-desktop",
+)
+
+_DESKTOP_APPS = (
+    "Firefox",
+    "Slack",
+    "Figma",
+    "Postman",
+    "Discord",
+    "Spotify",
+    "Notion",
+    "Zoom",
+    "LibreOffice",
+    "GIMP",
+    "Inkscape",
+)
+
+_WINGET_APPS = (
+    "Microsoft.PowerToys",
+    "Microsoft.VisualStudioCode",
+    "Microsoft.WindowsTerminal",
+    "Git.Git",
+    "Docker.DockerDesktop",
+    "Postman.Postman",
+    "Notion.Notion",
+    "SlackTechnologies.Slack",
+    "Zoom.Zoom",
+    "Spotify.Spotify",
+    "Discord.Discord",
+    "Google.Chrome",
+    "Mozilla.Firefox",
+    "Figma.Figma",
+    "GitHub.GitHubDesktop",
+    "Microsoft.Teams",
+    "Microsoft.OneDrive",
+    "Microsoft.Edge",
+    "Obsidian.Obsidian",
+    "Insomnia.Insomnia",
+    "TablePlus.TablePlus",
+)
+
+_CHOCO_PACKAGES = (
+    "nodejs",
+    "python",
+    "git",
+    "7zip",
+    "openssl.light",
+    "curl",
+    "wget",
+    "jq",
+    "ripgrep",
+    "fzf",
+    "docker-desktop",
+    "kubectl",
+    "helm",
+    "terraform",
+    "awscli",
+    "azure-cli",
+    "gcloudsdk",
+    "make",
+    "cmake",
+    "neovim",
+)
+
+_SCOOP_PACKAGES = (
+    "git",
+    "ripgrep",
+    "jq",
+    "fzf",
+    "nodejs",
+    "python",
+    "go",
+    "rustup",
+    "openssh",
+    "curl",
+    "wget",
+    "7zip",
+    "neovim",
+    "make",
+)
+
+_STORE_APPS = (
+    "Spotify.Spotify",
+    "Microsoft.PowerToys",
+    "Microsoft.WindowsTerminal",
+    "WhatsApp.WhatsApp",
+    "Instagram.Instagram",
+)
+
+_PROGRAM_FILES_APPS = (
+    "Visual Studio Code",
+    "Slack",
+    "Figma",
+    "Postman",
+    "Discord",
+    "Spotify",
+    "Notion",
+    "Zoom",
+    "GitHub Desktop",
+    "Microsoft Teams",
+    "Docker Desktop",
+    "Google Chrome",
+)
+
+
+def spec_entries(
+    names, entry_type, source, cmd_prefix, tags, rationale_prefix, rationale_suffix="."
+):
+    # The tags tuple is shared by every spec in the batch.
+    return [
         {
-            "title": "pip: black",
-            "entry_type": "package",
-            "source": "pip",
-            "cmd": "pip install black",
-            "tags": ["python", "formatting"],
-            "rationale": "Predictable formatting avoids style diffs in shared scripts.",
-            "verification": "black --version",
-        },
+            "title": name,
+            "entry_type": entry_type,
+            "source": source,
+            "cmd": cmd_prefix + name,
+            "tags": tags,
+            "rationale": rationale_prefix + " " + name + rationale_suffix,
+        }
+        for name in names
     ]
 
-    def package_entries(names, source, cmd_prefix, tags, rationale_prefix):
-        specs = []
-        for name in names:
-            specs.append(
-                {
-                    "title": name,
-                    "entry_type": "package",
-                    "source": source,
-                    "cmd": f"{cmd_prefix}{name}",
-                    "tags": tags,
-                    "rationale": f"{rationale_prefix} {name}.",
-                }
-            )
-        return specs
-
-    def app_entries(names, source, cmd_prefix, tags, rationale_prefix):
-        specs = []
-        for name in names:
-            specs.append(
-                {
-                    "title": name,
-                    "entry_type": "application",
-                    "source": source,
-                    "cmd": f"{cmd_prefix}{name}",
-                    "tags": tags,
-                    "rationale": f"{rationale_prefix} {name}.",
-                }
-            )
-        return specs
-
-    if os_name == "macos":
-        brew_formulae = [
-            "ripgrep",
-            "jq",
-            "bat",
-            "fd",
-            "fzf",
-            "gh",
-            "htop",
-            "tree",
-            "wget",
-            "curl",
-            "git",
-            "git-lfs",
-            "python",
-            "node",
-            "go",
-            "rust",
-            "cmake",
-            "openssl@3",
-            "sqlite",
-            "postgresql",
-            "redis",
-            "docker",
-            "docker-compose",
-            "kubectl",
-            "helm",
-            "terraform",
-            "awscli",
-            "gcloud",
-            "k9s",
-            "pandoc",
-            "ffmpeg",
-            "tesseract",
-            "graphviz",
-            "imagemagick",
-            "ngrok",
-            "zstd",
-            "xz",
-            "rsync",
-            "rclone",
-            "openjdk",
-            "gradle",
-            "maven",
-            "direnv",
-            "shellcheck",
-            "pre-commit",
-            "poetry",
-            "pipx",
-            "uv",
-        ]
-        brew_casks = [
-            "Visual Studio Code",
-            "Slack",
-            "Figma",
-            "Postman",
-            "Google Chrome",
-            "Raycast",
-            "Docker Desktop",
-            "Notion",
-            "Zoom",
-            "Spotify",
-            "Discord",
-            "1Password",
-            "Warp",
-            "Obsidian",
-            "Arc",
-            "Alfred",
-            "Rectangle",
-            "Miro",
-            "Notion Calendar",
-            "Microsoft Teams",
-            "Microsoft Word",
-            "Microsoft Excel",
-            "Microsoft PowerPoint",
-            "GitHub Desktop",
-            "Insomnia",
-            "TablePlus",
-            "Android Studio",
-            "Xcode",
-            "iTerm",
-            "Chrome Canary",
-            "Firefox",
-            "Brave Browser",
-            "Whimsical",
-        ]
-        mac_defaults = [
-            "NSGlobalDomain",
-            "com.apple.finder",
-            "com.apple.dock",
-            "com.apple.screencapture",
-            "com.apple.trackpad",
-            "com.apple.controlcenter",
-            "com.apple.universalaccess",
-            "com.apple.SoftwareUpdate",
-            "com.apple.menuextra.clock",
-            "com.apple.screensaver",
-        ]
 
-        specs = base
-        specs += package_entries(
-            brew_formulae,
+_TAGS_CLI_TOOLING = ("cli", "tooling")
+_TAGS_APPLICATION = ("application",)
+
+# Per-OS spec batches, one row per spec_entries call:
+# (names, entry_type, source, cmd_prefix, tags, rationale_prefix[, rationale_suffix]).
+_OS_TABLES = {
+    "macos": [
+        (
+            _BREW_FORMULAE,
+            "package",
             "homebrew",
             "brew install ",
-            ["cli", "tooling"],
+            _TAGS_CLI_TOOLING,
             "Installed via Homebrew to standardize",
-        )
-        specs += app_entries(
-            brew_casks,
+        ),
+        (
+            _BREW_CASKS,
+            "application",
             "homebrew",
             "brew install --cask ",
-            ["application"],
+            _TAGS_APPLICATION,
             "Installed via Homebrew cask for",
-        )
-        specs += [
-            {
-                "title": domain,
-                "entry_type": "config",
-                "source": "mac_defaults",
-                "cmd": f"defaults read {domain}",
-                "tags": ["config", "macos"],
-                "rationale": f"Captures defaults for {domain} to keep UI behavior consistent.",
-            }
-            for domain in mac_defaults
-        ]
-        return specs
-
-    if os_name == "linux":
-        apt_packages = [
-            "build-essential",
-            "curl",
-            "wget",
-            "git",
-            "git-lfs",
-            "ripgrep",
-            "jq",
-            "fzf",
-            "fd-find",
-            "htop",
-            "tree",
-            "python3",
-            "python3-pip",
-            "nodejs",
-            "npm",
-            "docker.io",
-            "docker-compose",
-            "kubectl",
-            "helm",
-            "terraform",
-            "sqlite3",
-            "postgresql",
-            "redis-server",
-            "openssh-client",
-            "rsync",
-            "unzip",
-            "zip",
-            "make",
-            "cmake",
-            "clang",
-            "openssl",
-            "neovim",
-        ]
-        pacman_packages = [
-            "base-devel",
-            "git",
-            "ripgrep",
-            "jq",
-            "fzf",
-            "fd",
-            "htop",
-            "tree",
-            "python",
-            "nodejs",
-            "npm",
-            "docker",
-            "docker-compose",
-            "kubectl",
-            "helm",
-            "terraform",
-            "postgresql",
-            "redis",
-            "sqlite",
-            "openssh",
-            "rsync",
-            "cmake",
-            "neovim",
-        ]
-        dnf_packages = [
-            "git",
-            "ripgrep",
-            "jq",
-            "fzf",
-            "htop",
-            "tree",
-            "python3",
-            "nodejs",
-            "npm",
-            "docker",
-            "docker-compose",
-            "kubectl",
-            "helm",
-            "terraform",
-            "postgresql",
-            "redis",
-            "sqlite",
-            "openssh",
-            "rsync",
-            "cmake",
-            "neovim",
-        ]
-        flatpak_apps = [
-            "org.mozilla.firefox",
-            "com.slack.Slack",
-            "com.visualstudio.code",
-            "com.spotify.Client",
-            "com.discordapp.Discord",
-            "md.obsidian.Obsidian",
-            "com.getpostman.Postman",
-            "com.github.IsmaelMartinez.teams_for_linux",
-            "com.google.Chrome",
-            "io.dbeaver.DBeaverCommunity",
-            "com.todoist.Todoist",
-            "org.gnome.Calculator",
-            "org.gnome.Terminal",
-        ]
-        snap_apps = [
-            "postman",
-            "spotify",
-            "slack",
-            "code",
-            "discord",
-            "chromium",
-            "notion-snap",
-            "zoom-client",
-            "intellij-idea-community",
-            "pycharm-community",
-            "insomnia",
-            "telegram-desktop",
-        ]
-        desktop_apps = [
-            "Firefox",
-            "Slack",
-            "Figma",
-            "Postman",
-            "Discord",
-            "Spotify",
-            "Notion",
-            "Zoom",
-            "LibreOffice",
-            "GIMP",
-            "Inkscape",
-        ]
-
-        specs = base
-        specs += package_entries(
-            apt_packages,
+        ),
+        (
+            _MAC_DEFAULTS,
+            "config",
+            "mac_defaults",
+            "defaults read ",
+            ("config", "macos"),
+            "Captures defaults for",
+            " to keep UI behavior consistent.",
+        ),
+    ],
+    "linux": [
+        (
+            _APT_PACKAGES,
+            "package",
             "apt",
             "sudo apt-get install ",
-            ["cli", "tooling"],
+            _TAGS_CLI_TOOLING,
             "Installed via apt to standardize",
-        )
-        specs += package_entries(
-            dnf_packages,
+        ),
+        (
+            _DNF_PACKAGES,
+            "package",
             "dnf",
             "sudo dnf install ",
-            ["cli", "tooling"],
+            _TAGS_CLI_TOOLING,
             "Installed via dnf to standardize",
-        )
-        specs += package_entries(
-            pacman_packages,
+        ),
+        (
+            _PACMAN_PACKAGES,
+            "package",
             "pacman",
             "sudo pacman -S ",
-            ["cli", "tooling"],
+            _TAGS_CLI_TOOLING,
             "Installed via pacman to standardize",
-        )
-        specs += app_entries(
-            flatpak_apps,
+        ),
+        (
+            _FLATPAK_APPS,
+            "application",
             "flatpak",
             "flatpak install ",
-            ["application"],
+            _TAGS_APPLICATION,
             "Installed via Flatpak for",
-        )
-        specs += app_entries(
-            snap_apps,
+        ),
+        (
+            _SNAP_APPS,
+            "application",
             "snap",
             "sudo snap install ",
-            ["application"],
+            _TAGS_APPLICATION,
             "Installed via Snap for",
-        )
-        specs += app_entries(
-            desktop_apps,
+        ),
+        (
+            _DESKTOP_APPS,
+            "application",
             "applications",
             "gtk-launch ",
-            ["application"],
+            _TAGS_APPLICATION,
             "Desktop application entry for",
-        )
-        return specs
-
-    if os_name == "windows":
-        winget_apps = [
-            "Microsoft.PowerToys",
-            "Microsoft.VisualStudioCode",
-            "Microsoft.WindowsTerminal",
-            "Git.Git",
-            "Docker.DockerDesktop",
-            "Postman.Postman",
-            "Notion.Notion",
-            "SlackTechnologies.Slack",
-            "Zoom.Zoom",
-            "Spotify.Spotify",
-            "Discord.Discord",
-            "Google.Chrome",
-            "Mozilla.Firefox",
-            "Figma.Figma",
-            "GitHub.GitHubDesktop",
-            "Microsoft.Teams",
-            "Microsoft.OneDrive",
-            "Microsoft.Edge",
-            "Obsidian.Obsidian",
-            "Insomnia.Insomnia",
-            "TablePlus.TablePlus",
-        ]
-        choco_packages = [
-            "nodejs",
-            "python",
-            "git",
-            "7zip",
-            "openssl.light",
-            "curl",
-            "wget",
-            "jq",
-            "ripgrep",
-            "fzf",
-            "docker-desktop",
-            "kubectl",
-            "helm",
-            "terraform",
-            "awscli",
-            "azure-cli",
-            "gcloudsdk",
-            "make",
-            "cmake",
-            "neovim",
-        ]
-        scoop_packages = [
-            "git",
-            "ripgrep",
-            "jq",
-            "fzf",
-            "nodejs",
-            "python",
-            "go",
-            "rustup",
-            "openssh",
-            "curl",
-            "wget",
-            "7zip",
-            "neovim",
-            "make",
-        ]
-        store_apps = [
-            "Spotify.Spotify",
-            "Microsoft.PowerToys",
-            "Microsoft.WindowsTerminal",
-            "WhatsApp.WhatsApp",
-            "Instagram.Instagram",
-        ]
-        program_files_apps = [
-            "Visual Studio Code",
-            "Slack",
-            "Figma",
-            "Postman",
-            "Discord",
-            "Spotify",
-            "Notion",
-            "Zoom",
-            "GitHub Desktop",
-            "Microsoft Teams",
-            "Docker Desktop",
-            "Google Chrome",
-        ]
-
-        specs = base
-        specs += app_entries(
-            winget_apps,
+        ),
+    ],
+    "windows": [
+        (
+            _WINGET_APPS,
+            "application",
             "winget",
             "winget install --id ",
-            ["application"],
+            _TAGS_APPLICATION,
             "Installed via winget for",
-        )
-        specs += package_entries(
-            choco_packages,
+        ),
+        (
+            _CHOCO_PACKAGES,
+            "package",
             "chocolatey",
             "choco install ",
-            ["cli", "tooling"],
+            _TAGS_CLI_TOOLING,
             "Installed via Chocolatey to standardize",
-        )
-        specs += package_entries(
-            scoop_packages,
+        ),
+        (
+            _SCOOP_PACKAGES,
+            "package",
             "scoop",
             "scoop install ",
-            ["cli", "tooling"],
+            _TAGS_CLI_TOOLING,
             "Installed via Scoop to standardize",
-        )
-        specs += app_entries(
-            store_apps,
+        ),
+        (
+            _STORE_APPS,
+            "application",
             "msstore",
             "winget install --id ",
-            ["application"],
+            _TAGS_APPLICATION,
             "Installed via Microsoft Store for",
-        )
-        specs += app_entries(
-            program_files_apps,
+        ),
+        (
+            _PROGRAM_FILES_APPS,
+            "application",
             "applications",
             "start ",
-            ["application"],
+            _TAGS_APPLICATION,
             "Installed locally for",
-        )
-        return specs
+        ),
+    ],
+}
 
-    return base
 
+_BASE_DEMO_SPECS = (
+    {
+        "title": ".gitconfig",
+        "entry_type": "config",
+        "source": "dotfiles",
+        "cmd": "open ~/.gitconfig",
+        "tags": ("config", "git"),
+        "rationale": "Consistent author identity and diff settings reduce review friction.",
+    },
+    {
+        "title": ".zshrc",
+        "entry_type": "config",
+        "source": "dotfiles",
+        "cmd": "open ~/.zshrc",
+        "tags": ("shell", "config"),
+        "rationale": "Shell settings keep tooling and aliases aligned.",
+    },
+    {
+        "title": "CLI bootstrap script",
+        "entry_type": "script",
+        "source": "manual",
+        "cmd": "./scripts/bootstrap.sh",
+        "tags": ("bootstrap", "automation"),
+        "rationale": "Single entrypoint reduces onboarding time for new machines.",
+    },
+    {
+        "title": "README.md onboarding notes",
+        "entry_type": "config",
+        "source": "manual",
+        "cmd": "open docs/guides/user-manual.md",
+        "tags": ("documentation",),
+        "rationale": "Keeps setup steps visible and reviewed during handoffs.",
+    },
+    {
+        "title": "npm: typescript",
+        "entry_type": "package",
+        "source": "npm",
+        "cmd": "npm install -g typescript",
+        "tags": ("typescript", "tooling"),
+        "rationale": "Global tsc keeps CLI scripts and build steps aligned.",
+        "verification": "tsc --version",
+    },
+    {
+        "title": "npm: eslint",
+        "entry_type": "package",
+        "source": "npm",
+        "cmd": "npm install -g eslint",
+        "tags": ("lint", "tooling"),
+        "rationale": "Baseline linting keeps code quality consistent.",
+        "verification": "eslint --version",
+    },
+    {
+        "title": "npm: prettier",
+        "entry_type": "package",
+        "source": "npm",
+        "cmd": "npm install -g prettier",
+        "tags": ("formatting",),
+        "rationale": "Shared formatting prevents noisy diffs.",
+        "verification": "prettier --version",
+    },
+    {
+        "title": "cargo: just",
+        "entry_type": "package",
+        "source": "cargo",
+        "cmd": "cargo install just",
+        "tags": ("task-runner", "cli"),
+        "rationale": "One command surface for common project workflows.",
+        "verification": "just --version",
+    },
+    {
+        "title": "pip: black",
+        "entry_type": "package",
+        "source": "pip",
+        "cmd": "pip install black",
+        "tags": ("python", "formatting"),
+        "rationale": "Predictable formatting avoids style diffs in shared scripts.",
+        "verification": "black --version",
+    },
+)
 
-def build_inbox_specs(os_name):
-    base = [
+
+def build_demo_specs(os_name):
+    specs = list(_BASE_DEMO_SPECS)
+    for names, entry_type, source, cmd_prefix, tags, *rationale in _OS_TABLES.get(os_name, ()):
+        specs += spec_entries(names, entry_type, source, cmd_prefix, tags, *rationale)
+    return specs
+
+
+_INBOX_EXTRAS = {
+    "macos": (
         {
-            "title": "gh",
+            "title": "bat",
             "entry_type": "package",
-            "source": "homebrew" if os_name == "macos" else "apt",
-            "cmd": "brew install gh" if os_name == "macos" else "sudo apt-get install gh",
-            "tags": ["git", "cli"],
+            "source": "homebrew",
+            "cmd": "brew install bat",
+            "tags": ("cli", "preview"),
         },
         {
-            "title": ".zshrc",
-            "entry_type": "config",
-            "source": "dotfiles",
-            "cmd": "open ~/.zshrc",
-            "tags": ["shell", "config"],
+            "title": "Rectangle",
+            "entry_type": "application",
+            "source": "homebrew",
+            "cmd": "brew install --cask rectangle",
+            "tags": ("productivity",),
         },
         {
-            "title": "Discord",
+            "title": "Google Chrome",
             "entry_type": "application",
-            "source": "homebrew" if os_name == "macos" else "winget",
-            "cmd": "brew install --cask discord" if os_name == "macos" else "winget install --id Discord.Discord",
-            "tags": ["communication"],
+            "source": "homebrew",
+            "cmd": "brew install --cask google-chrome",
+            "tags": ("browser",),
         },
         {
-            "title": "Notion",
+            "title": "Warp",
             "entry_type": "application",
-            "source": "homebrew" if os_name == "macos" else "winget",
-            "cmd": "brew install --cask notion" if os_name == "macos" else "winget install --id Notion.Notion",
-            "tags": ["notes"],
+            "source": "homebrew",
+            "cmd": "brew install --cask warp",
+            "tags": ("terminal",),
         },
-    ]
-
-    if os_name == "macos":
-        return base + [
-            {
-                "title": "bat",
-                "entry_type": "package",
-                "source": "homebrew",
-                "cmd": "brew install bat",
-                "tags": ["cli", "preview"],
-            },
-            {
-                "title": "Rectangle",
-                "entry_type": "application",
-                "source": "homebrew",
-                "cmd": "brew install --cask rectangle",
-                "tags": ["productivity"],
-            },
-            {
-                "title": "Google Chrome",
-                "entry_type": "application",
-                "source": "homebrew",
-                "cmd": "brew install --cask google-chrome",
-                "tags": ["browser"],
-            },
-            {
-                "title": "Warp",
-                "entry_type": "application",
-                "source": "homebrew",
-                "cmd": "brew install --cask warp",
-                "tags": ["terminal"],
-            },
-            {
-                "title": "Raycast",
-                "entry_type": "application",
-                "source": "homebrew",
-                "cmd": "brew install --cask raycast",
-                "tags": ["productivity"],
-            },
-            {
-                "title": "htop",
-                "entry_type": "package",
-                "source": "homebrew",
-                "cmd": "brew install htop",
-                "tags": ["monitoring"],
-            },
-        ]
-    if os_name == "linux":
-        return base + [
-            {
-                "title": "neovim",
-                "entry_type": "package",
-                "source": "pacman",
-                "cmd": "sudo pacman -S neovim",
-                "tags": ["editor"],
-            },
-            {
-                "title": "postman",
-                "entry_type": "application",
-                "source": "snap",
-                "cmd": "sudo snap install postman",
-                "tags": ["api", "testing"],
-            },
-            {
-                "title": "Firefox",
-                "entry_type": "application",
-                "source": "flatpak",
-                "cmd": "flatpak install org.mozilla.firefox",
-                "tags": ["browser"],
-            },
-            {
-                "title": "htop",
-                "entry_type": "package",
-                "source": "apt",
-                "cmd": "sudo apt-get install htop",
-                "tags": ["monitoring"],
-            },
-            {
-                "title": "docker",
-                "entry_type": "package",
-                "source": "apt",
-                "cmd": "sudo apt-get install docker.io",
-                "tags": ["containers"],
-            },
-        ]
-    if os_name == "windows":
-        return base + [
-            {
-                "title": "Microsoft PowerToys",
-                "entry_type": "application",
-                "source": "winget",
-                "cmd": "winget install --id Microsoft.PowerToys",
-                "tags": ["productivity"],
-            },
-            {
-                "title": "Git",
-                "entry_type": "package",
-                "source": "scoop",
-                "cmd": "scoop install git",
-                "tags": ["git", "cli"],
-            },
-            {
-                "title": "Node.js",
-                "entry_type": "package",
-                "source": "chocolatey",
-                "cmd": "choco install nodejs -y",
-                "tags": ["runtime"],
-            },
-            {
-                "title": "Visual Studio Code",
-                "entry_type": "application",
-                "source": "winget",
-                "cmd": "winget install --id Microsoft.VisualStudioCode",
-                "tags": ["editor"],
-            },
-        ]
-    return base
-
-
-def build_fallback_inbox_specs():
-    return [
         {
-            "title": "git",
-            "entry_type": "package",
-            "source": "manual",
-            "cmd": "git --version",
-            "tags": ["git", "cli"],
+            "title": "Raycast",
+            "entry_type": "application",
+            "source": "homebrew",
+            "cmd": "brew install --cask raycast",
+            "tags": ("productivity",),
         },
         {
-            "title": "node",
+            "title": "htop",
             "entry_type": "package",
-            "source": "manual",
-            "cmd": "node --version",
-            "tags": ["runtime"],
+            "source": "homebrew",
+            "cmd": "brew install htop",
+            "tags": ("monitoring",),
         },
+    ),
+    "linux": (
         {
-            "title": "python",
+            "title": "neovim",
             "entry_type": "package",
-            "source": "manual",
-            "cmd": "python --version",
-            "tags": ["runtime"],
+            "source": "pacman",
+            "cmd": "sudo pacman -S neovim",
+            "tags": ("editor",),
         },
         {
-            "title": "curl",
+            "title": "postman",
+            "entry_type": "application",
+            "source": "snap",
+            "cmd": "sudo snap install postman",
+            "tags": ("api", "testing"),
+        },
+        {
+            "title": "Firefox",
+            "entry_type": "application",
+            "source": "flatpak",
+            "cmd": "flatpak install org.mozilla.firefox",
+            "tags": ("browser",),
+        },
+        {
+            "title": "htop",
             "entry_type": "package",
-            "source": "manual",
-            "cmd": "curl --version",
-            "tags": ["network", "cli"],
+            "source": "apt",
+            "cmd": "sudo apt-get install htop",
+            "tags": ("monitoring",),
         },
         {
-            "title": "fzf",
+            "title": "docker",
             "entry_type": "package",
-            "source": "manual",
-            "cmd": "fzf --version",
-            "tags": ["cli", "search"],
+            "source": "apt",
+            "cmd": "sudo apt-get install docker.io",
+            "tags": ("containers",),
         },
+    ),
+    "windows": (
         {
-            "title": "make",
+            "title": "Microsoft PowerToys",
+            "entry_type": "application",
+            "source": "winget",
+            "cmd": "winget install --id Microsoft.PowerToys",
+            "tags": ("productivity",),
+        },
+        {
+            "title": "Git",
             "entry_type": "package",
-            "source": "manual",
-            "cmd": "make --version",
-            "tags": ["toolchain"],
+            "source": "scoop",
+            "cmd": "scoop install git",
+            "tags": ("git", "cli"),
         },
         {
-            "title": "tmux",
+            "title": "Node.js",
             "entry_type": "package",
-            "source": "manual",
-            "cmd": "tmux -V",
-            "tags": ["terminal"],
+            "source": "chocolatey",
+            "cmd": "choco install nodejs -y",
+            "tags": ("runtime",),
+        },
+        {
+            "title": "Visual Studio Code",
+            "entry_type": "application",
+            "source": "winget",
+            "cmd": "winget install --id Microsoft.VisualStudioCode",
+            "tags": ("editor",),
         },
+    ),
+}
+
+
+def build_inbox_specs(os_name):
+    base = [
         {
-            "title": "zsh",
+            "title": "gh",
             "entry_type": "package",
-            "source": "manual",
-            "cmd": "zsh --version",
-            "tags": ["shell"],
+            "source": "homebrew" if os_name == "macos" else "apt",
+            "cmd": "brew install gh" if os_name == "macos" else "sudo apt-get install gh",
+            "tags": ("git", "cli"),
+        },
+        {
+            "title": ".zshrc",
+            "entry_type": "config",
+            "source": "dotfiles",
+            "cmd": "open ~/.zshrc",
+            "tags": ("shell", "config"),
+        },
+        {
+            "title": "Discord",
+            "entry_type": "application",
+            "source": "homebrew" if os_name == "macos" else "winget",
+            "cmd": "brew install --cask discord" if os_name == "macos" else "winget install --id Discord.Discord",
+            "tags": ("communication",),
+        },
+        {
+            "title": "Notion",
+            "entry_type": "application",
+            "source": "homebrew" if os_name == "macos" else "winget",
+            "cmd": "brew install --cask notion" if os_name == "macos" else "winget install --id Notion.Notion",
+            "tags": ("notes",),
         },
     ]
 
+    return base + list(_INBOX_EXTRAS.get(os_name, ()))
+
+
+_FALLBACK_SPECS = (
+    {
+        "title": "git",
+        "entry_type": "package",
+        "source": "manual",
+        "cmd": "git --version",
+        "tags": ("git", "cli"),
+    },
+    {
+        "title": "node",
+        "entry_type": "package",
+        "source": "manual",
+        "cmd": "node --version",
+        "tags": ("runtime",),
+    },
+    {
+        "title": "python",
+        "entry_type": "package",
+        "source": "manual",
+        "cmd": "python --version",
+        "tags": ("runtime",),
+    },
+    {
+        "title": "curl",
+        "entry_type": "package",
+        "source": "manual",
+        "cmd": "curl --version",
+        "tags": ("network", "cli"),
+    },
+    {
+        "title": "fzf",
+        "entry_type": "package",
+        "source": "manual",
+        "cmd": "fzf --version",
+        "tags": ("cli", "search"),
+    },
+    {
+        "title": "make",
+        "entry_type": "package",
+        "source": "manual",
+        "cmd": "make --version",
+        "tags": ("toolchain",),
+    },
+    {
+        "title": "tmux",
+        "entry_type": "package",
+        "source": "manual",
+        "cmd": "tmux -V",
+        "tags": ("terminal",),
+    },
+    {
+        "title": "zsh",
+        "entry_type": "package",
+        "source": "manual",
+        "cmd": "zsh --version",
+        "tags": ("shell",),
+    },
+)
+
+
+_SNOOZED_EXTRAS = {
+    "linux": (
+        {
+            "title": "Spotify",
+            "entry_type": "application",
+            "source": "flatpak",
+            "cmd": "flatpak install com.spotify.Client",
+            "tags": ("media",),
+        },
+    ),
+    "windows": (
+        {
+            "title": "Spotify",
+            "entry_type": "application",
+            "source": "msstore",
+            "cmd": "winget install --id Spotify.Spotify",
+            "tags": ("media",),
+        },
+    ),
+}
+
 
 def build_snoozed_specs(os_name):
     base = [
@@ -887,31 +974,11 @@ def build_snoozed_specs(os_name):
             "entry_type": "application",
             "source": "homebrew" if os_name == "macos" else "winget",
             "cmd": "brew install --cask zoom" if os_name == "macos" else "winget install --id Zoom.Zoom",
-            "tags": ["communication"],
+            "tags": ("communication",),
         },
     ]
 
-    if os_name == "windows":
-        return base + [
-            {
-                "title": "Spotify",
-                "entry_type": "application",
-                "source": "msstore",
-                "cmd": "winget install --id Spotify.Spotify",
-                "tags": ["media"],
-            },
-        ]
-    if os_name == "linux":
-        return base + [
-            {
-                "title": "Spotify",
-                "entry_type": "application",
-                "source": "flatpak",
-                "cmd": "flatpak install com.spotify.Client",
-                "tags": ["media"],
-            },
-        ]
-    return base
+    return base + list(_SNOOZED_EXTRAS.get(os_name, ()))
 
 
 def main():
@@ -930,37 +997,46 @@ def main():
     os.makedirs(entries_root, exist_ok=True)
     os.makedirs(state_root, exist_ok=True)
 
-    system = detect_system()
+    os_name, arch = detect_system()
+    # Every entry shares the same system, so quote it for YAML once up front.
+    os_yaml = yaml_quote(os_name)
+    arch_yaml = yaml_quote(arch)
+    detected_at = now_iso()
     rng = random.Random(42)
 
-    demo_specs = build_demo_specs(system[0])
-    rng.shuffle(demo_specs)
-    entries = [make_entry(system, spec) for spec in demo_specs]
+    demo_specs = build_demo_specs(os_name)
+    demo_specs = rng.sample(demo_specs, len(demo_specs))
+    entries = [make_entry(os_yaml, arch_yaml, spec, detected_at) for spec in demo_specs]
 
+    buckets = defaultdict(list)
     for entry in entries:
-        path = entry_path(root, entry)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        write_entry(path, entry)
+        buckets[(entry.entry_type, entry.source)].append(entry)
+    # Buckets own disjoint directories, so they can be written concurrently while
+    # each bucket's files are still written back-to-back into the same directory.
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        jobs = [
+            executor.submit(write_bucket, entries_root, entry_type, source, group)
+            for (entry_type, source), group in buckets.items()
+        ]
+        for job in jobs:
+            job.result()
 
-    inbox_specs = build_inbox_specs(system[0])
-    rng.shuffle(inbox_specs)
+    inbox_specs = build_inbox_specs(os_name)
+    inbox_specs = rng.sample(inbox_specs, len(inbox_specs))
     if len(inbox_specs) < args.inbox:
-        fallback = build_fallback_inbox_specs()
-        rng.shuffle(fallback)
         existing = {spec["title"] for spec in inbox_specs}
-        for spec in fallback:
-            if spec["title"] in existing:
-                continue
-            inbox_specs.append(spec)
-            existing.add(spec["title"])
-            if len(inbox_specs) >= args.inbox:
-                break
+        fallback = rng.sample(_FALLBACK_SPECS, len(_FALLBACK_SPECS))
+        inbox_specs += itertools.islice(
+            (spec for spec in fallback if spec["title"] not in existing),
+            args.inbox - len(inbox_specs),
+        )
     inbox_specs = inbox_specs[: args.inbox]
-    inbox_items = [make_detected(system, spec) for spec in inbox_specs]
+    inbox_items = [make_detected(os_yaml, arch_yaml, spec, detected_at) for spec in inbox_specs]
     write_yaml_list(os.path.join(state_root, "inbox.yaml"), inbox_items)
 
-    snoozed_specs = build_snoozed_specs(system[0])
-    snoozed_items = [make_detected(system, spec) for spec in snoozed_specs]
+    snoozed_specs = build_snoozed_specs(os_name)
+    snoozed_items = [make_detected(os_yaml, arch_yaml, spec, detected_at) for spec in snoozed_specs]
     write_yaml_list(os.path.join(state_root, "snoozed.yaml"), snoozed_items)
 
     print(f"Seeded vault at {root}")